@@ -0,0 +1,315 @@
+"""
+Sharded front-end dispatcher: split one workload trace over N scheduler
+instances and merge their logs into one result set.
+
+Each instance is the Go scheduler (src/main) replaying its own sub-trace,
+pinned together with its jobs to its own core group (-c offset). In
+"cores" mode all instances share this host on disjoint core groups; in
+"nodes" mode they are spread over --hosts and started through --launcher
+(e.g. ssh or docker exec), with disjoint groups per host. Nodes must see
+the same paths (binary, workdir, output dir), e.g. via a shared mount.
+
+Example: 64 cores as 8 TLA instances, power-of-two-choices routing
+    python dispatcher.py --trace workloads/workload1.txt --cores 64 \
+        --instances 8 --route p2c --out evaluation/results/shard8 -- -adm shed
+"""
+import argparse
+import os
+import random
+import re
+import shlex
+import subprocess
+import time
+
+import numpy as np
+
+TIME_RE   = re.compile(r"logs TIME:\s+(\S+)\s+(\S+)\s+(\S+)\s+Request#\s+(\d+)")
+REJECT_RE = re.compile(r"logs REJECT:\s+(\S+)\s+(.*?)\s+Rejected#\s+(\d+)")
+DUR_RE    = re.compile(r"(\d+(?:\.\d+)?)(h|ms|µs|us|ns|m|s)")
+DUR_UNITS = {"h": 3600e3, "m": 60e3, "s": 1e3, "ms": 1.0,
+             "µs": 1e-3, "us": 1e-3, "ns": 1e-6}
+
+
+def parse_duration_ms(value):
+    """Convert a Go duration string (e.g. '1m31.17s', '850µs') to ms."""
+    return sum(float(n) * DUR_UNITS[u] for n, u in DUR_RE.findall(value))
+
+
+def read_trace(path):
+    """Return (line, fib_n, start) tuples of a workload file."""
+    jobs = []
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) < 5:
+                continue
+            jobs.append((line.rstrip("\n"), int(parts[2]), int(parts[3])))
+    return jobs
+
+
+def read_optimal(path):
+    """fib N -> isolated run time (ms), used as the predicted burst size."""
+    opt = {}
+    with open(path, "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 2:
+                opt[int(parts[0])] = float(parts[1])
+    return opt
+
+
+############################################
+# Routing policies
+############################################
+
+class Router:
+    """
+    Tracks the predicted outstanding work (ms) per instance. Instance i
+    drains its backlog at `cores[i]` ms per ms, mirroring the STCF
+    simulator's use of optimal.txt as the burst predictor.
+    """
+
+    def __init__(self, cores, optimal, policy, seed=0):
+        self.load    = [0.0] * len(cores)
+        self.cores   = cores
+        self.optimal = optimal
+        self.policy  = policy
+        self.next    = 0
+        self.now     = 0.0
+        self.rng     = random.Random(seed)
+
+    def predict(self, fib_n):
+        if fib_n in self.optimal:
+            return self.optimal[fib_n]
+        # outside the table: extrapolate with fib's ~1.618x growth
+        lower = [k for k in self.optimal if k <= fib_n]
+        known = max(lower) if lower else min(self.optimal)
+        return self.optimal[known] * 1.618 ** (fib_n - known)
+
+    def advance(self, t):
+        dt = t - self.now
+        self.load = [max(l - dt * c, 0.0) for l, c in zip(self.load, self.cores)]
+        self.now = t
+
+    def route(self, fib_n, t):
+        self.advance(t)
+        n = len(self.load)
+        if self.policy == "rr":
+            idx = self.next
+            self.next = (self.next + 1) % n
+        elif self.policy == "least":
+            # ties (e.g. idle instances) rotate instead of piling onto 0
+            idx = min(range(n), key=lambda i: (self.load[i], (i - self.next) % n))
+            self.next = (idx + 1) % n
+        elif self.policy == "p2c":
+            a, b = self.rng.sample(range(n), 2) if n > 1 else (0, 0)
+            idx = a if self.load[a] <= self.load[b] else b
+        else:
+            raise ValueError(f"Unknown routing policy: {self.policy}")
+        self.load[idx] += self.predict(fib_n)
+        return idx
+
+
+############################################
+# Instances
+############################################
+
+def core_groups(cores, instances, hosts=None):
+    """
+    (host, offset, count) per instance; host is None when running locally.
+    Leftover cores go to the first instances. Instances are spread over
+    hosts round-robin and get disjoint core groups on each host.
+    """
+    base, extra = divmod(cores, instances)
+    groups, offsets = [], {}
+    for i in range(instances):
+        host  = hosts[i % len(hosts)] if hosts else None
+        count = base + (1 if i < extra else 0)
+        groups.append((host, offsets.get(host, 0), count))
+        offsets[host] = offsets.get(host, 0) + count
+    return groups
+
+
+def split_trace(jobs, router, out_dir):
+    """
+    Write one sub-trace per instance. Returns their paths, sizes and the
+    first arrival (ms) of each, so the instance can be started then.
+    """
+    shards  = [[] for _ in router.load]
+    firsts  = [None] * len(shards)
+    routing = []
+    for line, fib_n, start in jobs:
+        # readTrace.go scales the trace start column by 9 (ms)
+        idx = router.route(fib_n, start * 9)
+        shards[idx].append(line)
+        if firsts[idx] is None:
+            firsts[idx] = start * 9
+        routing.append(f"{line.split()[0]} {idx}")
+
+    paths = []
+    for i, shard in enumerate(shards):
+        path = os.path.join(out_dir, f"trace{i}.txt")
+        with open(path, "w") as f:
+            f.write("\n".join(shard) + ("\n" if shard else ""))
+        paths.append(path)
+    with open(os.path.join(out_dir, "routing.txt"), "w") as f:
+        f.write("\n".join(routing) + "\n")
+    return paths, [len(s) for s in shards], firsts
+
+
+def start_instances(args, groups, traces, sizes, firsts, out_dir):
+    """
+    Launch one scheduler per non-empty sub-trace; return (idx, proc, log).
+    The scheduler sends its first job at startup and then sleeps the gaps,
+    so each instance is started at its shard's first arrival to keep all
+    shards on the original trace's timeline. The scheduler process itself
+    is pinned to its core group too, so instances do not disturb each other.
+    """
+    procs = []
+    order = sorted((i for i in range(len(traces)) if sizes[i]), key=lambda i: firsts[i])
+    t0 = time.monotonic()
+    for i in order:
+        host, offset, count = groups[i]
+        cores = range(offset, offset + count)
+        cmd = [args.bin, "-p", args.sched, "-t", os.path.abspath(traces[i]),
+               "-n", str(count), "-c", str(offset),
+               "-o", os.path.abspath(args.optimal)] + args.extra
+        if host is None:
+            popen = dict(cwd=args.workdir,
+                         preexec_fn=lambda cores=cores: os.sched_setaffinity(0, cores))
+        else:
+            # the launcher gets the remote shell command as its last argument
+            remote = (f"cd {shlex.quote(args.workdir)} && exec taskset -c "
+                      f"{offset}-{offset + count - 1} {shlex.join(cmd)}")
+            cmd = shlex.split(args.launcher.format(host=host)) + [remote]
+            popen = {}
+        log_path = os.path.join(out_dir, f"instance{i}.txt")
+        log = open(log_path, "w")
+        delay = t0 + firsts[i] / 1000.0 - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        print(f"[INFO] instance {i}: {sizes[i]} jobs from {firsts[i]} ms, "
+              f"{host or 'local'} cores {offset}-{offset + count - 1}")
+        procs.append((i, subprocess.Popen(cmd, stdout=log, stderr=subprocess.STDOUT,
+                                          **popen), log))
+    return procs
+
+
+############################################
+# Merge
+############################################
+
+def merge_logs(out_dir, instances, name):
+    """
+    Merge the TIME / REJECT lines of all instance logs into <name>.txt
+    (renumbered globally so draw526final.py can read it as one scheduler)
+    and return turnaround times (ms) per instance.
+    """
+    turnaround = {}
+    merged = []
+    completed = rejected = 0
+    for i in instances:
+        path = os.path.join(out_dir, f"instance{i}.txt")
+        turnaround[i] = []
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                m = TIME_RE.search(line)
+                if m:
+                    completed += 1
+                    turnaround[i].append(parse_duration_ms(m.group(3)))
+                    merged.append(f"logs TIME:  {m.group(1)} {m.group(2)} "
+                                  f"{m.group(3)} Request# {completed} Instance# {i}")
+                    continue
+                m = REJECT_RE.search(line)
+                if m:
+                    rejected += 1
+                    merged.append(f"logs REJECT:  {m.group(1)} {m.group(2)} "
+                                  f"Rejected# {rejected} Instance# {i}")
+    with open(os.path.join(out_dir, f"{name}.txt"), "w", encoding="utf-8") as f:
+        f.write("\n".join(merged) + "\n")
+    return turnaround, rejected
+
+
+def write_summary(out_dir, turnaround, rejected):
+    """Per-instance and overall turnaround percentiles (ms)."""
+    rows = [(f"instance{i}", t) for i, t in sorted(turnaround.items())]
+    rows.append(("all", [x for t in turnaround.values() for x in t]))
+    path = os.path.join(out_dir, "shard_percentiles.txt")
+    with open(path, "w") as f:
+        f.write("Instance\tCompleted\tP50\tP90\tP99\tP99.9\n")
+        for label, times in rows:
+            if not times:
+                f.write(f"{label}\t0\t0\t0\t0\t0\n")
+                continue
+            p = [np.percentile(times, q) for q in (50, 90, 99, 99.9)]
+            f.write(f"{label}\t{len(times)}\t" +
+                    "\t".join(f"{v:.2f}" for v in p) + "\n")
+        f.write(f"# rejected\t{rejected}\n")
+    return path
+
+
+############################################
+# Main
+############################################
+
+def parse_args():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--trace", required=True, help="workload file")
+    parser.add_argument("--instances", type=int, default=2, help="# of scheduler instances")
+    parser.add_argument("--cores", type=int, default=16, help="total # of cpu cores")
+    parser.add_argument("--route", default="p2c", choices=["rr", "least", "p2c"],
+                        help="routing policy")
+    parser.add_argument("--mode", default="cores", choices=["cores", "nodes"],
+                        help="core groups on this host, or instances spread over --hosts")
+    parser.add_argument("--hosts", default=None,
+                        help="comma-separated node names for --mode nodes")
+    parser.add_argument("--launcher", default="ssh {host}",
+                        help="command prefix to run on a node, e.g. 'docker exec {host} sh -c'")
+    parser.add_argument("--sched", default="tla", help="scheduler policy passed as -p")
+    parser.add_argument("--bin", default=os.path.join(here, "src", "main"),
+                        help="scheduler binary (go build in src/)")
+    parser.add_argument("--workdir", default=here, help="directory holding fib.py")
+    parser.add_argument("--optimal", default=os.path.join(here, "workloads", "optimal.txt"),
+                        help="STCF optimal values, used as burst predictor")
+    parser.add_argument("--out", default="shard_result", help="output directory")
+    parser.add_argument("--name", default=None,
+                        help="merged log name (default: <sched>_<instances>x<route>)")
+    parser.add_argument("--seed", type=int, default=0, help="p2c random seed")
+    parser.add_argument("extra", nargs="*", help="extra scheduler flags after --")
+    args = parser.parse_args()
+    if args.instances < 1 or args.cores < args.instances:
+        parser.error("need 1 <= --instances <= --cores")
+    hosts = args.hosts.split(",") if args.hosts else None
+    if args.mode == "nodes" and not hosts:
+        parser.error("--mode nodes needs --hosts")
+    args.groups = core_groups(args.cores, args.instances,
+                              hosts if args.mode == "nodes" else None)
+    local = os.cpu_count() or 0
+    for host, offset, count in args.groups:
+        if host is None and offset + count > local:
+            parser.error(f"--cores {args.cores} exceeds the {local} cores of this host")
+    return args
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    os.makedirs(args.out, exist_ok=True)
+    name = args.name or f"{args.sched}_{args.instances}x{args.route}"
+
+    groups = args.groups
+    router = Router([c for _, _, c in groups], read_optimal(args.optimal),
+                    args.route, args.seed)
+    traces, sizes, firsts = split_trace(read_trace(args.trace), router, args.out)
+
+    procs = start_instances(args, groups, traces, sizes, firsts, args.out)
+    for i, proc, log in procs:
+        proc.wait()
+        log.close()
+        if proc.returncode != 0:
+            print(f"[WARN] instance {i} exited with {proc.returncode}")
+
+    turnaround, rejected = merge_logs(args.out, [i for i, _, _ in procs], name)
+    summary = write_summary(args.out, turnaround, rejected)
+    print(f"[INFO] merged log: {os.path.join(args.out, name + '.txt')}")
+    print(f"[INFO] percentiles: {summary}")
@@ -112,15 +112,25 @@ with open(refer_path, "r", encoding="utf-8") as f:
 # execution_data[scheduler][fib_id_int] = <avg execution time in ms>
 # tail_latency_data[scheduler][fib_id_int] = <(turnaround/SLO) - 1>
 
+# rejected_data[scheduler][fib_id_int] = <admission reason: full|deadline|shed>
+# Rejected requests never run, so they are kept out of the latency data
+# and only show up in the goodput table.
+
 execution_data = {}
 tail_latency_data = {}
+rejected_data = {}
 
 for sched in scheduler_types:
     file_list = sorted(glob.glob(os.path.join(workload_path, f"{sched}.txt")))
     execution_records = {}
+    rejected_records = {}
     for file_path in file_list:
         with open(file_path, "r", encoding="utf-8") as f:
             for line in f:
+                reject = re.search(r"logs REJECT:\s+fib(\d+)\s+(\w+)", line)
+                if reject:
+                    rejected_records[int(reject.group(1))] = reject.group(2)
+                    continue
                 match = re.search(
                     r"logs TIME:\s+fib(\d+)\s+([\d.]+)(µs|ms|s)\s+((?:\d+m)?[\d.]+)(µs|ms|s)\s+Request#\s+(\d+)",
                     line
@@ -136,6 +146,7 @@ for sched in scheduler_types:
     # Average each fib's times
     avg_exec_time = {k: np.mean(v) for k, v in execution_records.items()}
     execution_data[sched] = avg_exec_time
+    rejected_data[sched] = rejected_records
 
     # Tail lat = (exec_time / SLO) - 1
     tail_latencies = {}
@@ -168,6 +179,7 @@ for fib_key, fib_n in fib_id_to_n.items():
 
 execution_data["ideal"] = ideal_exec_data
 tail_latency_data["ideal"] = ideal_tail_data
+rejected_data["ideal"] = {}
 
 scheduler_types.append("ideal")
 scheduler_types = sorted(scheduler_types, key=lambda s: 0 if s == 'ideal' else 1)
@@ -233,6 +245,28 @@ with open(tail_table_path, "w") as f:
                f"{pvals['P99']:.4f}", f"{pvals['P99.9']:.4f}"]
         f.write(f"{sched}\t" + "\t".join(row) + "\n")
 
+############################################
+# 6b) Create admission_with_schedulers.txt
+#     (Offered / completed / rejected requests, goodput)
+############################################
+
+# Goodput = completed / offered; "InSLO" additionally requires the
+# turnaround to stay within 2x the SLO (tail latency <= 1).
+offered = len(fib_id_to_n)
+adm_table_path = os.path.join(workload_path, "admission_with_schedulers.txt")
+with open(adm_table_path, "w") as f:
+    f.write("Scheduler\tOffered\tCompleted\tRejected\tShed\tExpired\tGoodput\tInSLO\n")
+    for sched in scheduler_types:
+        rejected  = rejected_data[sched]
+        completed = len(execution_data[sched])
+        shed      = sum(1 for r in rejected.values() if r == "shed")
+        expired   = sum(1 for r in rejected.values() if r == "deadline")
+        in_slo    = sum(1 for t in tail_latency_data[sched].values() if t <= 1)
+        goodput   = completed / offered if offered else 0
+        in_slo_r  = in_slo / offered if offered else 0
+        f.write(f"{sched}\t{offered}\t{completed}\t{len(rejected)}\t{shed}\t"
+                f"{expired}\t{goodput:.4f}\t{in_slo_r:.4f}\n")
+
 ############################################
 # 7) Draw Percentile Breakdown Bar Charts
 ############################################
@@ -394,10 +428,11 @@ plt.close()
 print("Done! Generated files in:", workload_path)
 print("  1) percentiles_with_schedulers.txt")
 print("  2) tail_with_schedulers.txt")
-print("  3) bar_execution_breakdown.png")
-print("  4) bar_tail_breakdown.png")
-print("  5) cdf_execution_time_log.png")
-print("  6) cdf_tail_latency_log.png")
+print("  3) admission_with_schedulers.txt")
+print("  4) bar_execution_breakdown.png")
+print("  5) bar_tail_breakdown.png")
+print("  6) cdf_execution_time_log.png")
+print("  7) cdf_tail_latency_log.png")
 
 
 
@@ -0,0 +1,264 @@
+// admission.go
+// Admission control with bounded per-layer queues for overload protection.
+// Jobs are admitted while the FIFO layer and the CFS layer are below their
+// bounds; otherwise the configured policy rejects, defers or sheds them.
+
+package main
+
+import (
+	"fmt"
+	"log"
+	"sync"
+	"sync/atomic"
+	"time"
+)
+
+/* ------------------------------------------------------------------ */
+/*  Tunable parameters (set once from main.go via -adm* flags)         */
+/* ------------------------------------------------------------------ */
+
+var (
+	admPolicy   = "none" // none | reject | defer | shed
+	admFifoCap  = 64     // max jobs in the FIFO layer
+	admCfsCap   = 256    // max jobs demoted to the CFS layer
+	admWaitCap  = 64     // waiting-room size for defer / shed
+	admDeadline = 100    // max wait before a deferred job is rejected (ms)
+)
+
+// Global counter for rejection decisions (logged as Rejected#)
+var rejectedRequests int32 = 0
+
+// Global admission controller; nil unless -adm is set
+var admissionGlobal *Admission = nil
+
+const (
+	layerFIFO = 1
+	layerCFS  = 2
+)
+
+/* ------------------------------------------------------------------ */
+/*  Core data structures                                              */
+/* ------------------------------------------------------------------ */
+
+type Admission struct {
+	mu       sync.Mutex
+	policy   string
+	fifo     int          // jobs currently in the FIFO layer
+	cfs      int          // jobs currently in the CFS layer
+	layer    map[int]int  // job-id → layer
+	waiting  []pendingJob // deferred jobs, arrival order
+	entry    int          // layer admitted jobs are counted in
+	admitted int32
+	launch   func(Action, time.Time) // starts an admitted job
+	drop     func(Action)            // notifies the caller of a rejection
+	stopCh   chan struct{}
+}
+
+type pendingJob struct {
+	job     Action
+	arrived time.Time
+}
+
+/* ------------------------------------------------------------------ */
+/*  Constructor                                                       */
+/* ------------------------------------------------------------------ */
+
+func NewAdmission(launch func(Action, time.Time), drop func(Action), entry int) *Admission {
+	switch admPolicy {
+	case "reject", "defer", "shed":
+	default:
+		log.Fatal("unknown admission policy ", admPolicy)
+	}
+	return &Admission{
+		policy: admPolicy,
+		layer:  make(map[int]int),
+		entry:  entry,
+		launch: launch,
+		drop:   drop,
+		stopCh: make(chan struct{}),
+	}
+}
+
+/* ------------------------------------------------------------------ */
+/*  Lifecycle hooks                                                   */
+/* ------------------------------------------------------------------ */
+
+func (a *Admission) StartMonitoring() {
+	if a.policy == "defer" {
+		go a.expireLoop()
+	}
+}
+func (a *Admission) StopMonitoring() { close(a.stopCh) }
+
+// Submit decides on a new arrival. It never blocks on a full layer.
+func (a *Admission) Submit(job Action) {
+	now := time.Now()
+	a.mu.Lock()
+	var run []pendingJob
+	var rej []pendingJob
+	var reasons []string
+	p := pendingJob{job, now}
+
+	if a.hasRoom() && len(a.waiting) == 0 {
+		a.admit(job.Id)
+		run = append(run, p)
+	} else {
+		switch a.policy {
+		case "reject":
+			rej, reasons = append(rej, p), append(reasons, "full")
+		case "defer":
+			if len(a.waiting) < admWaitCap {
+				a.waiting = append(a.waiting, p)
+				fmt.Println("logs DEFER: ", job.JobName, "Waiting#", len(a.waiting))
+			} else {
+				rej, reasons = append(rej, p), append(reasons, "full")
+			}
+		case "shed":
+			a.waiting = append(a.waiting, p)
+			if len(a.waiting) > admWaitCap {
+				victim := a.shedLargest()
+				rej, reasons = append(rej, victim), append(reasons, "shed")
+				if victim.job.Id == job.Id {
+					break
+				}
+			}
+			fmt.Println("logs DEFER: ", job.JobName, "Waiting#", len(a.waiting))
+		}
+	}
+	a.mu.Unlock()
+	a.dispatch(run, rej, reasons)
+}
+
+// Demote moves a job from the FIFO layer to the CFS layer, freeing a FIFO slot.
+func (a *Admission) Demote(jobID int) {
+	a.mu.Lock()
+	if a.layer[jobID] == layerFIFO {
+		a.layer[jobID] = layerCFS
+		a.fifo--
+		a.cfs++
+	}
+	run := a.pump()
+	a.mu.Unlock()
+	a.dispatch(run, nil, nil)
+}
+
+// Done releases the slot held by a finished job and admits waiting jobs.
+func (a *Admission) Done(jobID int) {
+	a.mu.Lock()
+	switch a.layer[jobID] {
+	case layerFIFO:
+		a.fifo--
+	case layerCFS:
+		a.cfs--
+	}
+	delete(a.layer, jobID)
+	run := a.pump()
+	a.mu.Unlock()
+	a.dispatch(run, nil, nil)
+}
+
+/* ------------------------------------------------------------------ */
+/*  Internal helpers (caller holds a.mu)                              */
+/* ------------------------------------------------------------------ */
+
+func (a *Admission) hasRoom() bool {
+	return a.fifo < admFifoCap && a.cfs < admCfsCap
+}
+
+func (a *Admission) admit(jobID int) {
+	if a.entry == layerCFS {
+		a.cfs++
+	} else {
+		a.fifo++
+	}
+	a.layer[jobID] = a.entry
+}
+
+func (a *Admission) pump() []pendingJob {
+	var run []pendingJob
+	for a.hasRoom() && len(a.waiting) > 0 {
+		p := a.waiting[0]
+		a.waiting = a.waiting[1:]
+		a.admit(p.job.Id)
+		run = append(run, p)
+	}
+	return run
+}
+
+// shedLargest removes the waiting job with the largest predicted burst
+// (fib N); on ties the latest arrival is shed.
+func (a *Admission) shedLargest() pendingJob {
+	idx := 0
+	for i, p := range a.waiting {
+		if p.job.Para >= a.waiting[idx].job.Para {
+			idx = i
+		}
+	}
+	p := a.waiting[idx]
+	a.waiting = append(a.waiting[:idx], a.waiting[idx+1:]...)
+	return p
+}
+
+/* ------------------------------------------------------------------ */
+/*  Decisions (called without a.mu held)                              */
+/* ------------------------------------------------------------------ */
+
+func (a *Admission) dispatch(run, rej []pendingJob, reasons []string) {
+	for _, p := range run {
+		idx := atomic.AddInt32(&a.admitted, 1)
+		fmt.Println("logs ADMIT: ", p.job.JobName, time.Since(p.arrived), "Admitted#", idx)
+		a.launch(p.job, p.arrived)
+	}
+	for i, p := range rej {
+		idx := atomic.AddInt32(&rejectedRequests, 1)
+		fmt.Println("logs REJECT: ", p.job.JobName, reasons[i], a.policy, "Rejected#", idx)
+		a.drop(p.job)
+	}
+}
+
+/* ------------------------------------------------------------------ */
+/*  Deadline loop (defer policy)                                      */
+/* ------------------------------------------------------------------ */
+
+func (a *Admission) expireLoop() {
+	ticker := time.NewTicker(time.Millisecond)
+	defer ticker.Stop()
+	for {
+		select {
+		case <-ticker.C:
+			a.expire()
+		case <-a.stopCh:
+			return
+		}
+	}
+}
+
+func (a *Admission) expire() {
+	deadline := time.Duration(admDeadline) * time.Millisecond
+	now := time.Now()
+	a.mu.Lock()
+	var rej []pendingJob
+	var reasons []string
+	kept := a.waiting[:0]
+	for _, p := range a.waiting {
+		if now.Sub(p.arrived) > deadline {
+			rej, reasons = append(rej, p), append(reasons, "deadline")
+		} else {
+			kept = append(kept, p)
+		}
+	}
+	a.waiting = kept
+	a.mu.Unlock()
+	a.dispatch(nil, rej, reasons)
+}
+
+/* ------------------------------------------------------------------ */
+/*  Termination helper                                                */
+/* ------------------------------------------------------------------ */
+
+// allRequestsSettled reports whether every request was completed or rejected.
+// rejected counts the rejections the caller has actually received, so no
+// rejection message can still be in flight once this returns true.
+func allRequestsSettled(num int, rejected int) bool {
+	return int(atomic.LoadInt32(&completedRequests))+rejected >= num
+}
@@ -26,11 +26,23 @@ type PidI struct {
 }
 
 func Send(job Action, pids chan PidI) {
-    o := time.Now()
+    SendAt(job, time.Now(), pids)
+}
+
+// SendAt submits a job whose turnaround is measured from arrival o
+// (admission control may have held it back since then).
+func SendAt(job Action, o time.Time, pids chan PidI) {
     new_pid := PidI{-10, job.JobName, job.Para, job.Id, o, -3}
     pids <- new_pid
 }
 
+// SendRejected tells the scheduler that a job will never run, so it can
+// stop once every request is either completed or rejected. It sends
+// synchronously: the scheduler only shuts down after receiving it.
+func SendRejected(job Action, pids chan PidI) {
+    pids <- PidI{-10, job.JobName, job.Para, job.Id, time.Now(), -4}
+}
+
 func Execute(job PidI, p string, pids chan PidI, core string, queue chan PidI) {
     var cmd *exec.Cmd
     start_time := job.St
@@ -68,6 +80,9 @@ func Execute(job PidI, p string, pids chan PidI, core string, queue chan PidI) {
         log.Fatal("exec 2", err)
     }
     t2 := time.Now()
+    if admissionGlobal != nil {
+        admissionGlobal.Done(job.Id)
+    }
     new_pid.Credit = -2
     pids <- new_pid
 
@@ -94,7 +109,7 @@ func ExecuteNoChannel(wg *sync.WaitGroup, job Action, p string, pids chan PidI,
     if p == "N" {
         cmd = exec.Command("schedtool", "-N", "-a", cpuC, "-e", "python", job.Exec, strconv.Itoa(job.Para), strconv.Itoa(job.Id))
     } else {
-        cmd = exec.Command("schedtool", "-R", "-p", "20", "-a", "0x1", "-e", "python", job.Exec, strconv.Itoa(job.Para), strconv.Itoa(job.Id))
+        cmd = exec.Command("schedtool", "-R", "-p", "20", "-a", GetFifoCpuSingleCpu(0), "-e", "python", job.Exec, strconv.Itoa(job.Para), strconv.Itoa(job.Id))
     }
 
     err := cmd.Start()
@@ -113,6 +128,9 @@ func ExecuteNoChannel(wg *sync.WaitGroup, job Action, p string, pids chan PidI,
         log.Fatal("exec 2", err)
     }
     t2 := time.Now()
+    if admissionGlobal != nil {
+        admissionGlobal.Done(job.Id)
+    }
 
     requestIndex := atomic.AddInt32(&completedRequests, 1)
     fmt.Println("logs TIME: ", job.JobName, t1.Sub(start_time), t2.Sub(start_time), "Request#", requestIndex)
@@ -5,6 +5,7 @@ import (
     "fmt"
     "os"
     "sync"
+    "sync/atomic"
     "syscall"
     "time"
 )
@@ -14,6 +15,12 @@ var (
 	tlaIntFlag    = flag.Int   ("tla_int",   25,   "TLA monitor interval (ms)")
 	tlaPctFlag    = flag.Int   ("tla_pct",   95,   "TLA percentile (80–99)")
 	tlaSliceFlag  = flag.Float64("tla_slice",1.2,  "TLA promote slice ×Ts")
+
+	admFlag       = flag.String("adm",       "none", "admission policy: none|reject|defer|shed")
+	admFifoFlag   = flag.Int   ("adm_fifo",  64,   "admission bound on FIFO-layer jobs")
+	admCfsFlag    = flag.Int   ("adm_cfs",   256,  "admission bound on CFS-layer jobs")
+	admWaitFlag   = flag.Int   ("adm_wait",  64,   "admission waiting-room size (defer/shed)")
+	admDdlFlag    = flag.Int   ("adm_ddl",   100,  "admission defer deadline (ms)")
 )
 
 func main() {
@@ -41,6 +48,7 @@ func main() {
     var optimal string
     flag.StringVar(&optimal, "o", "optimal.txt", "STCF optimal values")
     cpu := flag.Int("n", 16, "# of cpu cores")
+    core := flag.Int("c", 0, "first cpu core of this instance's core group")
     fmt.Println("logs main cpu", *cpu)
     flag.Parse()
 
@@ -50,6 +58,15 @@ func main() {
     tlaMonitorInterval = *tlaIntFlag
     tlaPercentile      = *tlaPctFlag
     tlaSliceMult       = *tlaSliceFlag
+    cpuOffset          = *core
+    cpuCores           = *cpu
+
+    // push CLI values into admission.go globals
+    admPolicy   = *admFlag
+    admFifoCap  = *admFifoFlag
+    admCfsCap   = *admCfsFlag
+    admWaitCap  = *admWaitFlag
+    admDeadline = *admDdlFlag
 
 
     fmt.Println("logs main cpu", *cpu)
@@ -82,14 +99,24 @@ func testSFS(cpu int, source string) {
     wg.Add(1)
     go Scheduler(&wg, cache, cpu, num)
 
+    startAdmission(
+        func(job Action, st time.Time) { go SendAt(job, st, cache) },
+        func(job Action) { SendRejected(job, cache) },
+        layerFIFO)
+
     for i := 0; i < len(trace); i++ {
-        go Send(trace[i], cache)
+        if admissionGlobal != nil {
+            admissionGlobal.Submit(trace[i])
+        } else {
+            go Send(trace[i], cache)
+        }
         if i < len(trace)-1 {
             time.Sleep(time.Duration(trace[i+1].Start-trace[i].Start) * time.Millisecond)
         }
     }
 
     wg.Wait()
+    stopAdmission()
     fmt.Println("DEBUG: All SFS requests processed")
     close(cache)
     fmt.Println("DEBUG: Cache channel closed.")
@@ -120,14 +147,24 @@ func testTLA(cpu int, source string) {
     // Store the TLA instance in a global variable for use in execute.go
     tlaInstanceGlobal = tlaInstance
 
+    startAdmission(
+        func(job Action, st time.Time) { go SendAt(job, st, cache) },
+        func(job Action) { SendRejected(job, cache) },
+        layerFIFO)
+
     for i := 0; i < len(trace); i++ {
-        go Send(trace[i], cache)
+        if admissionGlobal != nil {
+            admissionGlobal.Submit(trace[i])
+        } else {
+            go Send(trace[i], cache)
+        }
         if i < len(trace)-1 {
             time.Sleep(time.Duration(trace[i+1].Start-trace[i].Start) * time.Millisecond)
         }
     }
 
     wg.Wait()
+    stopAdmission()
     fmt.Println("DEBUG: All TLA-SFS requests processed")
     close(cache)
     fmt.Println("DEBUG: Cache channel closed.")
@@ -146,11 +183,20 @@ func testFIFO(cpu int, source string) {
     wg := sync.WaitGroup{}
     trace, _ := GetTrace(source)
     cache := make(chan PidI)
+    startAdmission(
+        func(job Action, _ time.Time) { go ExecuteNoChannel(&wg, job, "F", cache, start_time, "0xff") },
+        func(job Action) { wg.Done() },
+        layerFIFO)
     for _, v := range trace {
         wg.Add(1)
-        go ExecuteNoChannel(&wg, v, "F", cache, start_time, "0xff")
+        if admissionGlobal != nil {
+            admissionGlobal.Submit(v)
+        } else {
+            go ExecuteNoChannel(&wg, v, "F", cache, start_time, "0xff")
+        }
     }
     wg.Wait()
+    stopAdmission()
     logFile := "/result/fifo.txt"
     f, err := os.OpenFile(logFile, os.O_APPEND|os.O_WRONLY, 0644)
     if err == nil {
@@ -167,13 +213,22 @@ func testCFS(cpu int, source string) {
     cache := make(chan PidI)
     cpuC := GetCFSCpuCores(cpu)
     wg.Add(len(trace))
+    startAdmission(
+        func(job Action, _ time.Time) { go ExecuteNoChannel(&wg, job, "N", cache, start_time, cpuC) },
+        func(job Action) { wg.Done() },
+        layerCFS) // plain CFS has no FIFO layer; jobs count against -adm_cfs
     for i := 0; i < len(trace); i++ {
-        go ExecuteNoChannel(&wg, trace[i], "N", cache, start_time, cpuC)
+        if admissionGlobal != nil {
+            admissionGlobal.Submit(trace[i])
+        } else {
+            go ExecuteNoChannel(&wg, trace[i], "N", cache, start_time, cpuC)
+        }
         if i < len(trace)-1 {
             time.Sleep(time.Duration(trace[i+1].Start-trace[i].Start) * time.Millisecond)
         }
     }
     wg.Wait()
+    stopAdmission()
     logFile := "/result/cfs.txt"
     f, err := os.OpenFile(logFile, os.O_APPEND|os.O_WRONLY, 0644)
     if err == nil {
@@ -190,11 +245,20 @@ func testRR(cpu int, source string) {
     cache   := make(chan PidI)         // unused by ExecuteNoChannel, kept for symmetry
     cpuMask := GetCFSCpuCores(cpu)     // pin RR tasks to all logical CPUs
 
+    startAdmission(
+        func(job Action, _ time.Time) { go ExecuteNoChannel(&wg, job, "R", cache, startTime, cpuMask) },
+        func(job Action) { wg.Done() },
+        layerFIFO)
     for _, job := range trace {
         wg.Add(1)
-        go ExecuteNoChannel(&wg, job, "R", cache, startTime, cpuMask)
+        if admissionGlobal != nil {
+            admissionGlobal.Submit(job)
+        } else {
+            go ExecuteNoChannel(&wg, job, "R", cache, startTime, cpuMask)
+        }
     }
     wg.Wait()
+    stopAdmission()
 
     logFile := "/result/rr.txt"
     if f, err := os.OpenFile(logFile, os.O_APPEND|os.O_WRONLY|os.O_CREATE, 0644); err == nil {
@@ -203,3 +267,22 @@ func testRR(cpu int, source string) {
     }
     fmt.Println("All RR requests are served.")
 }
+
+// startAdmission installs the admission controller when -adm is set;
+// entry is the layer admitted jobs are counted in.
+func startAdmission(launch func(Action, time.Time), drop func(Action), entry int) {
+    if admPolicy == "none" {
+        return
+    }
+    admissionGlobal = NewAdmission(launch, drop, entry)
+    admissionGlobal.StartMonitoring()
+}
+
+func stopAdmission() {
+    if admissionGlobal == nil {
+        return
+    }
+    admissionGlobal.StopMonitoring()
+    fmt.Println("logs ADMISSION summary: policy", admPolicy, "admitted", atomic.LoadInt32(&admissionGlobal.admitted),
+        "rejected", atomic.LoadInt32(&rejectedRequests))
+}
@@ -1,26 +1,28 @@
 package main
 
 import(
-	"math"
 	"strconv"
+	"strings"
 )
 
+// first core of this instance's core group (set from main.go via -c),
+// so several instances can share one host without overlapping masks
+var cpuOffset = 0
+
+// # of cores in this instance's core group (set from main.go via -n)
+var cpuCores = 16
+
+// affinity is given as a cpu list ("64,65,...") rather than a hex mask,
+// since schedtool parses hex masks into a native word (64 cores max)
 func GetCFSCpuCores(cpu int)string{
-	var tenNum float64 = 0
+	list := make([]string, 0, cpu)
 	for i := 0; i < cpu; i++{
-		tenNum += math.Pow(2,float64(i))
+		list = append(list, strconv.Itoa(cpuOffset+i))
 	}
-	oxNum := strconv.FormatInt(int64(tenNum), 16)
-	ox := "0x"
-	ox += oxNum
-	//fmt.Println(ox)
-	return ox
+	//fmt.Println(list)
+	return strings.Join(list, ",")
 }
 
 func GetFifoCpuSingleCpu(cpu int)string{
-	tenNum := math.Pow(2,float64(cpu))
-	oxNum := strconv.FormatInt(int64(tenNum), 16)
-	ox := "0x"
-	ox += oxNum
-	return ox
+	return strconv.Itoa(cpuOffset+cpu)
 }
@@ -10,7 +10,6 @@ import(
     "log"
     "syscall"
     //"sort"
-	"sync/atomic"
 )
 
 var CFS_int int64 = 4
@@ -26,11 +25,20 @@ func receive(in chan PidI, queue chan PidI, core string,wg *sync.WaitGroup, num
 	//         3) send job to first queue
 	//fmt.Println("logs receive cpu", core)
 	num_job := 0
+	num_rejected := 0
 	var init_credit int
 	for{
 		select{
 		case x := <-in:
-			if jobs[x.Id] == 0 && x.Credit == -3{
+			if x.Credit == -4{
+				//rejected by admission control, never executed
+				num_rejected += 1
+				if allRequestsSettled(num, num_rejected) {
+					fmt.Println("All SFS requests are completed. Shutting down scheduler.")
+					wg.Done()
+					return
+				}
+			}else if jobs[x.Id] == 0 && x.Credit == -3{
 				jobs[x.Id] = 1
 				if ts.T > 6{
 					init_credit = ts.T
@@ -61,7 +69,7 @@ func receive(in chan PidI, queue chan PidI, core string,wg *sync.WaitGroup, num
 				//	return
 				//}
 				
-                if atomic.LoadInt32(&completedRequests) >= int32(num) {
+                if allRequestsSettled(num, num_rejected) {
 					fmt.Println("All SFS requests are completed. Shutting down scheduler.")
 					wg.Done()
 					return
@@ -288,6 +296,9 @@ func (q *Queue) Schedule(actions RWMap, cache chan PidI, in chan PidI, out chan
 			}else{
                                	//UpdateFunc(x.Pid, q.Core, "20")
 				go SwitchFunc(x.Pid, GetCFSCpuCores(cpu))
+				if admissionGlobal != nil {
+					admissionGlobal.Demote(x.Id)
+				}
 				cfs_chan <- x
 				if jobs[x.Id] != 2{
 					//4 means cfs state
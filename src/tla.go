@@ -191,7 +191,11 @@ func (t *TLA) checkTailJobs() {
 /* ------------------------------------------------------------------ */
 
 func (t *TLA) promoteJob(pid int) {
-	mask := GetCFSCpuCores(8) // adjust if needed
+	n := cpuCores // first 8 cores as before, but stay inside small groups
+	if n > 8 {
+		n = 8
+	}
+	mask := GetCFSCpuCores(n)
 	_ = exec.Command("schedtool", "-F", "-p", "20", "-a", mask, strconv.Itoa(pid)).Run()
 
 	time.Sleep(time.Duration(tlaSliceMult*float64(t.timeSlice)) * time.Millisecond)